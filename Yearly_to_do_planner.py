@@ -1,12 +1,38 @@
 import tkinter as tk
-from tkinter import ttk
+from tkinter import messagebox, ttk
 from datetime import date, datetime
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
 import calendar
+import hashlib
 import json
 import os
+import queue
+import re
+import threading
+import time
 
 
-DATA_FILE = "yearly_tasks.json"
+# Where calendars live; override with YEARLY_PLANNER_HOME
+DATA_DIR = os.environ.get("YEARLY_PLANNER_HOME") or os.path.join(os.path.expanduser("~"), ".yearly_planner")
+LEGACY_DATA_FILE = "yearly_tasks.json"
+DEFAULT_CALENDAR = "personal"
+ALL_CALENDARS = "All calendars"
+MAX_RESIDENT_CALENDARS = 3
+CALENDAR_NAME_RE = re.compile(r"^[A-Za-z0-9_-]{1,40}$")
+
+
+# Point-in-time history under DATA_DIR/snapshots/<calendar>
+SNAPSHOT_KEEP = 30
+SNAPSHOT_INTERVAL = 15 * 60  # seconds between automatic snapshots
+
+
+# Local automation API (127.0.0.1 only); 0 leaves it off
+API_PORT = int(os.environ.get("YEARLY_PLANNER_API_PORT", "0"))
+API_TIMEOUT = 10
+TASK_FIELDS = ("text", "start_time", "end_time", "feedback", "done")
 
 
 # Old-money style palette
@@ -21,9 +47,700 @@ TASK_ROW_ODD = "#f9f4ec"
 TASK_ROW_EVN = "#efe4d4"
 
 
+# Pixels the pointer must travel before a press on a task becomes a drag
+DRAG_THRESHOLD = 5
+
+
+# Month/year view models kept around for instant navigation
+VIEW_CACHE_SIZE = 24
+
+
 SCOLD_TEXT = "You said you'd do this by now, but it's still waiting. Lock in and finish it."
 
 
+def strip_scold(feedback):
+    return feedback.replace(SCOLD_TEXT, "").replace("  |  ", " ").strip()
+
+
+def count_by_month(tasks_data):
+    # "YYYY-MM" -> number of tasks
+    counts = {}
+    for k, tasks in tasks_data.items():
+        counts[k[:7]] = counts.get(k[:7], 0) + len(tasks)
+    return counts
+
+
+def months_from_day_counts(day_counts):
+    counts = {}
+    for k, n in day_counts.items():
+        counts[k[:7]] = counts.get(k[:7], 0) + n
+    return counts
+
+
+def build_month_model(count_of, y, m):
+    # counts, labels and colours for one month grid; safe to run off the Tk thread
+    cells = []
+    for day_num in range(1, calendar.monthrange(y, m)[1] + 1):
+        count = count_of(date(y, m, day_num).isoformat())
+        text = f"{day_num}\n{count} task" + ("" if count == 1 else "s")
+        bg = "#d8e4dd" if count > 0 else "#e8dfcf"
+        cells.append((day_num, count, text, bg))
+    return {"first_wd": date(y, m, 1).weekday(), "cells": cells}
+
+
+def build_year_model(month_counts, y):
+    months = []
+    for m in range(1, 13):
+        count = month_counts.get(f"{y:04d}-{m:02d}", 0)
+        months.append((count, "#d8e4dd" if count > 0 else "#e8dfcf"))
+    return months
+
+
+def read_tasks_file(path):
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        data = {}
+    return data, count_by_month(data)
+
+
+def write_json_file(path, data, indent=None):
+    # write next to the target and swap in, so a crash never leaves half a file
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=indent)
+    os.replace(tmp_path, path)
+
+
+def write_tasks_file(path, data, counts_path=None):
+    write_json_file(path, data, indent=2)
+    if counts_path is not None:
+        write_json_file(counts_path, {k: len(v) for k, v in data.items()})
+
+
+def read_day_counts(counts_path, path):
+    # per-day totals for a calendar that is not loaded; full parse only if the
+    # small counts file has never been written
+    try:
+        with open(counts_path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        data, _ = read_tasks_file(path)
+        return {k: len(v) for k, v in data.items()}
+
+
+def day_digest(tasks):
+    return hashlib.sha256(json.dumps(tasks, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def write_snapshot(snap_dir, base_days, changed, total, keep):
+    """Store changed days as content-addressed chunks plus a manifest; returns its days"""
+    chunk_dir = os.path.join(snap_dir, "chunks")
+    manifest_dir = os.path.join(snap_dir, "manifests")
+    os.makedirs(chunk_dir, exist_ok=True)
+    os.makedirs(manifest_dir, exist_ok=True)
+
+
+    days = dict(base_days or {})
+    for key, tasks in changed.items():
+        if not tasks:
+            days.pop(key, None)
+            continue
+        blob = json.dumps(tasks, sort_keys=True)
+        digest = hashlib.sha256(blob.encode("utf-8")).hexdigest()
+        chunk_path = os.path.join(chunk_dir, digest + ".json")
+        if not os.path.exists(chunk_path):
+            tmp_path = chunk_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                f.write(blob)
+            os.replace(tmp_path, chunk_path)
+        days[key] = digest
+
+
+    created = datetime.now()
+    snap_id = created.strftime("%Y%m%d-%H%M%S-%f")
+    write_json_file(os.path.join(manifest_dir, snap_id + ".json"), {
+        "created": created.isoformat(timespec="seconds"),
+        "tasks": total,
+        "days": days,
+    })
+
+
+    # rotate, then drop chunks no kept manifest points at
+    manifests = sorted(os.listdir(manifest_dir))
+    if len(manifests) > keep:
+        for fname in manifests[:-keep]:
+            os.remove(os.path.join(manifest_dir, fname))
+        live = set()
+        for fname in manifests[-keep:]:
+            with open(os.path.join(manifest_dir, fname), "r") as f:
+                live.update(json.load(f)["days"].values())
+        for fname in os.listdir(chunk_dir):
+            if fname[:-len(".json")] not in live:
+                os.remove(os.path.join(chunk_dir, fname))
+    return days
+
+
+def list_snapshots(snap_dir):
+    # newest first: (snapshot id, created, task count)
+    manifest_dir = os.path.join(snap_dir, "manifests")
+    if not os.path.isdir(manifest_dir):
+        return []
+    found = []
+    for fname in sorted(os.listdir(manifest_dir), reverse=True):
+        if not fname.endswith(".json"):
+            continue
+        with open(os.path.join(manifest_dir, fname), "r") as f:
+            manifest = json.load(f)
+        found.append((fname[:-len(".json")], manifest["created"], manifest["tasks"]))
+    return found
+
+
+def latest_snapshot_days(snap_dir):
+    # days of the newest manifest, or None if there is none worth building on
+    snapshots = list_snapshots(snap_dir)
+    if not snapshots:
+        return None
+    with open(os.path.join(snap_dir, "manifests", snapshots[0][0] + ".json"), "r") as f:
+        return json.load(f)["days"]
+
+
+def read_calendar_file(path, snap_dir):
+    """Parse a calendar and line it up with its newest snapshot.
+
+    Returns (data, month counts, snapshot days, keys that differ from that
+    snapshot), so the first snapshot of a session stays incremental and still
+    picks up edits made after the previous session's last snapshot.
+    """
+    data, month_counts = read_tasks_file(path)
+    try:
+        days = latest_snapshot_days(snap_dir)
+    except (OSError, ValueError, KeyError):
+        days = None  # unreadable history: the next snapshot is a full one
+    if days is None:
+        return data, month_counts, None, set()
+    stale = {k for k in days if k not in data}
+    stale.update(k for k, tasks in data.items() if days.get(k) != day_digest(tasks))
+    return data, month_counts, days, stale
+
+
+def read_snapshot(snap_dir, snap_id):
+    with open(os.path.join(snap_dir, "manifests", snap_id + ".json"), "r") as f:
+        days = json.load(f)["days"]
+    data = {}
+    for key, digest in sorted(days.items()):
+        with open(os.path.join(snap_dir, "chunks", digest + ".json"), "r") as f:
+            data[key] = json.load(f)
+    return data
+
+
+def list_calendars(data_dir):
+    names = set()
+    for fname in os.listdir(data_dir):
+        stem, ext = os.path.splitext(fname)
+        if ext == ".json" and CALENDAR_NAME_RE.match(stem):
+            names.add(stem)
+    names.add(DEFAULT_CALENDAR)
+    return sorted(names)
+
+
+class CalendarStore:
+    """One named calendar: its tasks, month count index and files on disk"""
+
+
+    def __init__(self, name, data_dir):
+        self.name = name
+        self.path = os.path.join(data_dir, name + ".json")
+        self.counts_path = os.path.join(data_dir, name + ".counts.json")
+        self.tasks_data = {}
+        self.month_counts = {}
+        self.loaded = False
+        self.loading = False
+        self.save_running = False
+        self.save_dirty = False
+        self.snapshot_dir = os.path.join(data_dir, "snapshots", name)
+        self.snapshot_days = None  # date key -> chunk hash of the last snapshot
+        self.snapshot_dirty = set()
+        self.snapshot_running = False
+        self.last_snapshot = None
+
+
+    def source_path(self):
+        # the old cwd-relative file seeds the default calendar the first time
+        if (self.name == DEFAULT_CALENDAR and not os.path.exists(self.path)
+                and os.path.exists(LEGACY_DATA_FILE)):
+            return LEGACY_DATA_FILE
+        return self.path
+
+
+    def day_counts(self):
+        return {k: len(v) for k, v in self.tasks_data.items()}
+
+
+    def touch(self, key):
+        # date keys changed since the last snapshot
+        self.snapshot_dirty.add(key)
+
+
+    def adjust_count(self, key, delta):
+        self.touch(key)
+        month = key[:7]
+        total = self.month_counts.get(month, 0) + delta
+        if total > 0:
+            self.month_counts[month] = total
+        else:
+            self.month_counts.pop(month, None)
+
+
+    def add_task(self, key, task):
+        self.tasks_data.setdefault(key, []).append(task)
+        self.adjust_count(key, 1)
+
+
+    def delete_task(self, key, index):
+        # raises KeyError / IndexError for a missing task; empty days are dropped
+        tasks = self.tasks_data[key]
+        task = tasks.pop(index)
+        if not tasks:
+            del self.tasks_data[key]
+        self.adjust_count(key, -1)
+        return task
+
+
+    def move_task(self, key, index, target_key):
+        task = self.delete_task(key, index)
+        task["feedback"] = strip_scold(task.get("feedback", ""))
+        self.add_task(target_key, task)
+        return task
+
+
+    def rollover(self, start_key, end_key, target_key):
+        """Move every unfinished task dated start_key..end_key onto target_key
+
+        Returns the number moved and the date keys that changed.
+        """
+        moved = []
+        touched = []
+        for key in sorted(self.tasks_data):
+            if key < start_key or key > end_key or key == target_key:
+                continue
+            tasks = self.tasks_data[key]
+            keep = [t for t in tasks if t["done"]]
+            if len(keep) == len(tasks):
+                continue
+            for t in tasks:
+                if not t["done"]:
+                    t["feedback"] = strip_scold(t.get("feedback", ""))
+                    moved.append(t)
+            if keep:
+                self.tasks_data[key] = keep
+            else:
+                del self.tasks_data[key]
+            self.adjust_count(key, len(keep) - len(tasks))
+            touched.append(key)
+
+
+        if moved:
+            self.tasks_data.setdefault(target_key, []).extend(moved)
+            self.adjust_count(target_key, len(moved))
+            touched.append(target_key)
+        return len(moved), touched
+
+
+    def index_of(self, key, task):
+        # position of this exact task dict, or None once it has moved or gone
+        for i, t in enumerate(self.tasks_data.get(key, ())):
+            if t is task:
+                return i
+        return None
+
+
+    def update_task(self, key, index, fields):
+        task = self.tasks_data[key][index]
+        task.update(fields)
+        if task["done"] and task.get("feedback"):
+            task["feedback"] = strip_scold(task["feedback"])
+        self.touch(key)
+        return task
+
+
+    def toggle_task(self, key, index):
+        return self.update_task(key, index, {"done": not self.tasks_data[key][index]["done"]})
+
+
+    def scold_task(self, key, index):
+        task = self.tasks_data[key][index]
+        task["feedback"] = (task.get("feedback", "") + "  |  " + SCOLD_TEXT).strip()
+        self.touch(key)
+        return task["feedback"]
+
+
+    def month_task_count(self, y, m):
+        # straight recount over the month's days, independent of month_counts
+        total = 0
+        for d in range(1, calendar.monthrange(y, m)[1] + 1):
+            total += len(self.tasks_data.get(date(y, m, d).isoformat(), []))
+        return total
+
+
+    def check_invariants(self):
+        """List every way the tasks and the count index disagree (empty when healthy)"""
+        problems = []
+        for key, tasks in self.tasks_data.items():
+            try:
+                if date.fromisoformat(key).isoformat() != key:
+                    raise ValueError
+            except ValueError:
+                problems.append(f"{key!r} is not a date key")
+            if not tasks:
+                problems.append(f"{key} is kept with no tasks")
+            for i, task in enumerate(tasks):
+                if task["done"] and SCOLD_TEXT in task.get("feedback", ""):
+                    problems.append(f"{key}[{i}] is done but still scolded")
+        expected = count_by_month(self.tasks_data)
+        for month in sorted(set(expected) | set(self.month_counts)):
+            if expected.get(month, 0) != self.month_counts.get(month, 0):
+                problems.append(f"{month} counted {self.month_counts.get(month, 0)}, "
+                                f"holds {expected.get(month, 0)}")
+        return problems
+
+
+def check_time(value):
+    # "9:5" parses too; store the zero-padded HH:MM the time pickers slice
+    if not isinstance(value, str):
+        raise ValueError(f"time must be HH:MM, got {value!r}")
+    return datetime.strptime(value, "%H:%M").strftime("%H:%M")
+
+
+def check_index(value):
+    # task positions arrive as JSON ints (batch) or digit strings (URL path)
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise ValueError(f"task index must be a whole number, got {value!r}")
+
+
+def clean_task_fields(fields):
+    # validated, normalised copy of whichever task fields the API input carries
+    if not isinstance(fields, dict):
+        raise ValueError("a task must be a JSON object")
+    unknown = set(fields) - set(TASK_FIELDS)
+    if unknown:
+        raise ValueError(f"unknown task fields: {', '.join(sorted(unknown))}")
+    clean = {}
+    if "text" in fields:
+        if not isinstance(fields["text"], str) or not fields["text"].strip():
+            raise ValueError("task text is required")
+        clean["text"] = fields["text"].strip()
+    for name in ("start_time", "end_time"):
+        if name in fields:
+            clean[name] = check_time(fields[name])
+    if "feedback" in fields:
+        if not isinstance(fields["feedback"], str):
+            raise ValueError("feedback must be a string")
+        clean["feedback"] = fields["feedback"]
+    if "done" in fields:
+        if not isinstance(fields["done"], bool):
+            raise ValueError("done must be true or false")
+        clean["done"] = fields["done"]
+    return clean
+
+
+def make_task(fields):
+    task = {
+        "text": "", "start_time": "09:00", "end_time": "10:00",
+        "feedback": "", "done": False
+    }
+    task.update(clean_task_fields(fields))
+    if not task["text"]:
+        raise ValueError("task text is required")
+    return task
+
+
+class LRUCache:
+    def __init__(self, maxsize, on_evict=None, can_evict=None):
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self.can_evict = can_evict
+        self.items = OrderedDict()
+
+
+    def get(self, key):
+        if key not in self.items:
+            return None
+        self.items.move_to_end(key)
+        return self.items[key]
+
+
+    def put(self, key, value):
+        self.items[key] = value
+        self.items.move_to_end(key)
+        while len(self.items) > self.maxsize:
+            old_key = next((k for k in self.items if self.can_evict is None or self.can_evict(k)), None)
+            if old_key is None:
+                break
+            old_value = self.items.pop(old_key)
+            if self.on_evict is not None:
+                self.on_evict(old_key, old_value)
+
+
+    def __contains__(self, key):
+        return key in self.items
+
+
+    def pop(self, key):
+        return self.items.pop(key, None)
+
+
+    def values(self):
+        return list(self.items.values())
+
+
+    def clear(self):
+        self.items.clear()
+
+
+class BackgroundWorker:
+    """Small thread pool whose results are handed back on the Tk thread"""
+
+
+    def __init__(self, root, max_workers=2, poll_ms=40):
+        self.root = root
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="planner")
+        self.results = queue.Queue()
+        self.calls = queue.Queue()
+        self.generations = {}
+        self.poll_ms = poll_ms
+        self.closed = False
+        self.root.after(self.poll_ms, self.poll)
+
+
+    def submit(self, fn, *args, on_done=None, on_error=None, tag=None):
+        # jobs sharing a tag are dropped once cancel(tag) is called after submit
+        gen = self.generations.get(tag, 0)
+
+
+        def run():
+            if self.generations.get(tag, 0) != gen:
+                return
+            try:
+                result = fn(*args)
+            except Exception as e:
+                self.results.put((tag, gen, on_error or self.report_error, e))
+            else:
+                self.results.put((tag, gen, on_done, result))
+
+
+        return self.pool.submit(run)
+
+
+    def cancel(self, tag):
+        self.generations[tag] = self.generations.get(tag, 0) + 1
+
+
+    def report_error(self, exc):
+        self.root.report_callback_exception(type(exc), exc, exc.__traceback__)
+
+
+    def call_in_ui(self, fn, *args):
+        # from any thread: run fn on the Tk thread, result comes back via the Future
+        future = Future()
+        self.calls.put((future, fn, args))
+        return future
+
+
+    def poll(self):
+        while True:
+            try:
+                future, fn, args = self.calls.get_nowait()
+            except queue.Empty:
+                break
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+        while True:
+            try:
+                tag, gen, callback, value = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if self.generations.get(tag, 0) != gen or callback is None:
+                continue
+            try:
+                callback(value)
+            except Exception as e:
+                self.report_error(e)
+        if not self.closed:
+            self.root.after(self.poll_ms, self.poll)
+
+
+    def shutdown(self):
+        self.closed = True
+        self.pool.shutdown(wait=True)
+
+
+class CalendarLoading(Exception):
+    pass
+
+
+class TaskApiHandler(BaseHTTPRequestHandler):
+    """JSON endpoints over the task store; every call is applied on the Tk thread
+
+    GET    /tasks?from=YYYY-MM-DD&to=YYYY-MM-DD   tasks by date in a range
+    GET    /tasks/<date>                          tasks for one day
+    GET    /counts?year=YYYY                      task totals per month
+    POST   /tasks/<date>                          add one task or a list of tasks
+    PATCH  /tasks/<date>/<index>                  change fields of a task
+    DELETE /tasks/<date>/<index>                  remove a task
+    POST   /batch                                 {"ops": [{"op": "add"|"update"|"delete", ...}]}
+
+    Every endpoint takes ?calendar=<name>; the calendar on screen is the default.
+    A calendar that is not loaded yet is read first, so its first call is slower.
+    /batch and list-bodied POSTs always answer with a list, one entry per op.
+
+
+    Only requests addressed to 127.0.0.1/localhost on this port are served, and
+    bodies must be sent as application/json, so web pages cannot reach the API
+    with simple cross-origin requests or DNS rebinding.
+    """
+
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+
+    def do_PATCH(self):
+        self.dispatch("PATCH")
+
+
+    def do_DELETE(self):
+        self.dispatch("DELETE")
+
+
+    def dispatch(self, method):
+        host = self.headers.get("Host", "")
+        port = self.server.server_address[1]
+        if host not in (f"127.0.0.1:{port}", f"localhost:{port}"):
+            self.send_json(403, {"error": "requests must be addressed to localhost"})
+            return
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            body = self.read_body() if method in ("POST", "PATCH") else None
+            ops, many = self.route(method, parts, query, body)
+            result = self.run_ops(query.get("calendar"), ops)
+            if not many:
+                result = result[0]
+        except CalendarLoading:
+            self.send_json(503, {"error": "calendar is still loading, try again"})
+        except (KeyError, IndexError, LookupError) as e:
+            self.send_json(404, {"error": str(e) or "not found"})
+        except (ValueError, TypeError) as e:
+            self.send_json(400, {"error": str(e)})
+        except (TimeoutError, FutureTimeoutError):
+            self.send_json(503, {"error": "planner is busy"})
+        except Exception as e:
+            self.send_json(500, {"error": repr(e)})
+        else:
+            self.send_json(201 if method == "POST" else 200, result)
+
+
+    def run_ops(self, calendar_name, ops):
+        # a calendar that is not resident loads on the worker; wait for it
+        deadline = time.monotonic() + API_TIMEOUT
+        while True:
+            future = self.server.app.worker.call_in_ui(self.server.app.apply_api_ops, calendar_name, ops)
+            try:
+                return future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except (TimeoutError, FutureTimeoutError):
+                # a call still queued must not run after the client was told it failed;
+                # one already running on the Tk thread is allowed to finish
+                if future.cancel():
+                    raise
+                return future.result()
+            except CalendarLoading:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.05)
+
+
+    def route(self, method, parts, query, body):
+        # translate the request into store operations, and whether to answer with a list
+        if parts == ["tasks"] and method == "GET":
+            return [{"op": "range", "from": query.get("from", ""), "to": query.get("to", "")}], False
+        if parts == ["counts"] and method == "GET":
+            return [{"op": "counts", "year": query.get("year", str(date.today().year))}], False
+        if parts == ["batch"] and method == "POST":
+            if not isinstance(body, dict) or not isinstance(body.get("ops"), list):
+                raise ValueError('expected {"ops": [...]}')
+            return body["ops"], True
+        if len(parts) == 2 and parts[0] == "tasks":
+            if method == "GET":
+                return [{"op": "get", "date": parts[1]}], False
+            if method == "POST":
+                tasks = body if isinstance(body, list) else [body]
+                return [{"op": "add", "date": parts[1], "task": t} for t in tasks], isinstance(body, list)
+        if len(parts) == 3 and parts[0] == "tasks":
+            if method == "PATCH":
+                return [{"op": "update", "date": parts[1], "index": parts[2], "task": body}], False
+            if method == "DELETE":
+                return [{"op": "delete", "date": parts[1], "index": parts[2]}], False
+        raise LookupError(f"no endpoint for {method} {self.path}")
+
+
+    def read_body(self):
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type != "application/json":
+            raise ValueError("request body must be sent as application/json")
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"null")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"invalid JSON: {e}")
+
+
+    def send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TaskApiServer:
+    """Optional localhost HTTP server running on its own daemon thread"""
+
+
+    def __init__(self, app, port):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), TaskApiHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.app = app
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="planner-api", daemon=True)
+
+
+    def start(self):
+        self.thread.start()
+
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
 class TimeSelector:
     def __init__(self, parent, title="Select Time", initial_time="00:00"):
         self.window = tk.Toplevel(parent)
@@ -98,14 +815,28 @@ class TimeSelector:
 
 
 class YearlyTodoApp:
-    def __init__(self, root):
+    def __init__(self, root, data_dir=None):
         self.root = root
         self.root.title("Yearly Todo Planner")
         self.root.geometry("950x700")
         self.root.configure(bg=BG_MAIN)
 
 
-        self.tasks_data = self.load_data()
+        self.worker = BackgroundWorker(self.root)
+        self.data_dir = data_dir or DATA_DIR
+        os.makedirs(self.data_dir, exist_ok=True)
+        # the calendar on screen is never evicted; API calls for others can't push it out
+        self.stores = LRUCache(
+            MAX_RESIDENT_CALENDARS, on_evict=self.store_evicted,
+            can_evict=self.store_evictable
+        )
+        self.evicted_stores = []
+        self.sidecar_counts = {}
+        self.combined = False
+        self.combined_counts = None
+        self.save_scheduled = False
+        self.view_cache = LRUCache(VIEW_CACHE_SIZE)
+        self.prefetch_job = None
         today = date.today()
         self.current_year = today.year
         self.current_month = today.month
@@ -113,33 +844,630 @@ class YearlyTodoApp:
         self.current_view = "month"
 
 
-        os.makedirs("task_data", exist_ok=True)
+        self.store = self.open_store(DEFAULT_CALENDAR)
 
 
         self.build_shell()
         self.show_month_view()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+
+        self.api_server = None
+        self.ui_refresh_keys = set()
+        if API_PORT:
+            self.api_server = TaskApiServer(self, API_PORT)
+            self.api_server.start()
 
 
     # ---------- data ----------
 
 
-    def load_data(self):
-        try:
-            with open(DATA_FILE, "r") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {}
+    @property
+    def tasks_data(self):
+        return self.store.tasks_data
+
+
+    @property
+    def month_counts(self):
+        return self.store.month_counts
+
+
+    @property
+    def loaded(self):
+        return self.store.loaded
+
+
+    def open_store(self, name):
+        store = self.stores.get(name)
+        if store is None:
+            # an evicted store still writing holds the newest data; bring it back
+            store = next((s for s in self.evicted_stores if s.name == name), None)
+            if store is not None:
+                self.evicted_stores.remove(store)
+            else:
+                store = CalendarStore(name, self.data_dir)
+            self.stores.put(name, store)
+        if not store.loaded and not store.loading:
+            self.load_data(store)
+        return store
+
+
+    def store_evictable(self, name):
+        return not hasattr(self, "store") or name != self.store.name
+
+
+    def store_evicted(self, name, store):
+        # keep its totals for the combined view, and finish any pending write
+        if store.loaded:
+            self.sidecar_counts[name] = store.day_counts()
+        if store.save_dirty or store.save_running:
+            self.evicted_stores.append(store)
+
+        # parse, count and diff against the last snapshot off the Tk thread
+    def load_data(self, store):
+        # parse, count and diff against the last snapshot off the Tk thread; the view redraws once data arrives
+        store.loading = True
+        self.worker.submit(
+            read_calendar_file, store.source_path(), store.snapshot_dir,
+            on_done=lambda result: self.data_loaded(store, result),
+            on_error=lambda exc: self.load_failed(store, exc),
+            tag="load:" + store.name
+        )
+
+
+    def data_loaded(self, store, result):
+        store.tasks_data, store.month_counts, store.snapshot_days, store.snapshot_dirty = result
+        store.loaded = True
+        store.loading = False
+        self.invalidate_calendar()
+        if store is self.store or self.combined:
+            self.refresh_view()
+
+
+    def load_failed(self, store, exc):
+        # stay unloaded so nothing saves over the unreadable file
+        store.loading = False
+        messagebox.showerror(
+            "Could not read tasks",
+            f"The {store.name} calendar could not be read from\n{store.source_path()}\n\n{exc}\n\n"
+            "Changes to it will not be saved until the file is fixed.",
+            parent=self.root
+        )
+
+
+    def save_data(self, store=None):
+        # coalesce every save requested during this event into one background write
+        store = store or self.store
+        if not store.loaded:
+            return
+        store.save_dirty = True
+        if not self.save_scheduled:
+            self.save_scheduled = True
+            self.root.after_idle(self.flush_data)
+
+
+    def flush_data(self):
+        self.save_scheduled = False
+        for store in self.stores.values() + self.evicted_stores:
+            self.flush_store(store)
+
+
+    def flush_store(self, store):
+        if store.save_running or not store.save_dirty:
+            return  # save_done picks up anything still dirty
+        store.save_dirty = False
+        store.save_running = True
+        snapshot = {k: [dict(t) for t in v] for k, v in store.tasks_data.items()}
+        self.worker.submit(
+            write_tasks_file, store.path, snapshot, store.counts_path,
+            on_done=lambda result: self.save_done(store),
+            on_error=lambda exc: self.save_failed(store, exc),
+            tag="save"
+        )
+        if store.last_snapshot is None or time.monotonic() - store.last_snapshot >= SNAPSHOT_INTERVAL:
+            self.take_snapshot(store)
+
+
+    def save_done(self, store):
+        store.save_running = False
+        if store.save_dirty:
+            self.flush_store(store)
+        elif store in self.evicted_stores:
+            self.evicted_stores.remove(store)
+
+
+    def save_failed(self, store, exc):
+        store.save_dirty = True
+        store.save_running = False
+        self.worker.report_error(exc)
 
 
-    def save_data(self):
-        with open(DATA_FILE, "w") as f:
-            json.dump(self.tasks_data, f, indent=2)
+    def on_close(self):
+        if self.api_server is not None:
+            self.api_server.stop()
+        self.worker.shutdown()
+        for store in self.stores.values() + self.evicted_stores:
+            if store.loaded and (store.save_dirty or store.save_running):
+                write_tasks_file(store.path, store.tasks_data, store.counts_path)
+        self.root.destroy()
 
 
     def date_key(self, d):
         return d.isoformat()
 
 
+    def adjust_count(self, key, delta):
+        self.store.adjust_count(key, delta)
+        self.invalidate_views(key)
+
+
+    # ---------- calendars ----------
+
+
+    def calendar_names(self):
+        return list_calendars(self.data_dir)
+
+
+    def switch_calendar(self, name):
+        self.worker.cancel("prefetch")
+        if name == ALL_CALENDARS:
+            self.combined = True
+            self.load_sidecars()
+        else:
+            self.combined = False
+            self.store = self.open_store(name)
+        self.refresh_view()
+
+
+    def load_sidecars(self):
+        # counts only: calendars that are not resident never load their tasks here
+        resident = {s.name for s in self.stores.values()}
+        for name in self.calendar_names():
+            if name in resident or name in self.sidecar_counts:
+                continue
+            store = CalendarStore(name, self.data_dir)
+            self.worker.submit(
+                read_day_counts, store.counts_path, store.source_path(),
+                on_done=lambda counts, n=name: self.sidecar_loaded(n, counts),
+                tag="sidecar"
+            )
+
+
+    def sidecar_loaded(self, name, counts):
+        self.sidecar_counts[name] = counts
+        self.invalidate_calendar()
+        if self.combined:
+            self.refresh_view()
+
+
+    def combined_day_counts(self):
+        if self.combined_counts is None:
+            resident = {s.name: s for s in self.stores.values() if s.loaded}
+            merged = {}
+            for name in self.calendar_names():
+                if name in resident:
+                    day_counts = resident[name].day_counts()
+                else:
+                    day_counts = self.sidecar_counts.get(name, {})
+                for k, n in day_counts.items():
+                    merged[k] = merged.get(k, 0) + n
+            self.combined_counts = (merged, months_from_day_counts(merged))
+        return self.combined_counts
+
+
+    def new_calendar_dialog(self):
+        dialog = tk.Toplevel(self.root)
+        dialog.title("New Calendar")
+        dialog.geometry("300x150")
+        dialog.configure(bg=BG_PANEL)
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+
+        tk.Label(dialog, text="Name (letters, digits, - or _)", bg=BG_PANEL, fg=TEXT_MAIN,
+                 font=("Georgia", 10, "bold")).pack(pady=(15, 5))
+        entry = tk.Entry(
+            dialog, font=("Georgia", 10), width=20,
+            bg=BG_MAIN, bd=0, highlightthickness=1,
+            highlightbackground=ACCENT
+        )
+        entry.pack()
+        entry.focus_set()
+        status = tk.Label(dialog, text="", bg=BG_PANEL, fg=ACCENT_DARK,
+                          font=("Georgia", 10, "italic"))
+        status.pack(pady=(5, 0))
+
+
+        def create(event=None):
+            name = entry.get().strip()
+            if not CALENDAR_NAME_RE.match(name) or name == ALL_CALENDARS:
+                status.config(text="Not a valid calendar name")
+                return
+            dialog.destroy()
+            store = CalendarStore(name, self.data_dir)
+            if not os.path.exists(store.path):
+                # empty file so the new calendar is listed from now on
+                write_tasks_file(store.path, {}, store.counts_path)
+            self.switch_calendar(name)
+            self.update_calendar_picker()
+
+
+        entry.bind("<Return>", create)
+        tk.Button(
+            dialog, text="Create", command=create,
+            bg=ACCENT, fg="white", font=("Georgia", 10, "bold"),
+            bd=0, padx=20, pady=5
+        ).pack(pady=10)
+
+
+    def update_calendar_picker(self):
+        names = self.calendar_names()
+        if self.store.name not in names:
+            names.append(self.store.name)
+        self.calendar_picker.config(values=names + [ALL_CALENDARS])
+        self.calendar_var.set(ALL_CALENDARS if self.combined else self.store.name)
+
+
+    # ---------- snapshots ----------
+
+
+    def take_snapshot(self, store, full=False, on_done=None, on_error=None):
+        # only days touched since the last snapshot are hashed; unchanged chunks are shared
+        if store.snapshot_running or not store.loaded:
+            return False
+        if full or store.snapshot_days is None:
+            keys = set(store.tasks_data) | set(store.snapshot_days or ())
+        else:
+            keys = store.snapshot_dirty
+        changed = {k: [dict(t) for t in store.tasks_data.get(k, [])] for k in keys}
+        pending, store.snapshot_dirty = store.snapshot_dirty, set()
+        store.snapshot_running = True
+        store.last_snapshot = time.monotonic()
+
+
+        def done(days):
+            store.snapshot_running = False
+            store.snapshot_days = days
+            if on_done is not None:
+                on_done()
+
+
+        def failed(exc):
+            store.snapshot_running = False
+            store.snapshot_dirty |= pending
+            (on_error or self.worker.report_error)(exc)
+
+
+        self.worker.submit(
+            write_snapshot, store.snapshot_dir, store.snapshot_days, changed,
+            sum(store.month_counts.values()), SNAPSHOT_KEEP,
+            on_done=done, on_error=failed, tag="snapshot"
+        )
+        return True
+
+
+    def restore_snapshot(self, store, snap_id, on_done=None, on_error=None):
+        """Read snap_id, snapshot the current state as an undo point, then swap it in"""
+        on_error = on_error or self.worker.report_error
+        if store.snapshot_running or not store.loaded:
+            return False
+        # holding the snapshot flag keeps automatic snapshots (and their
+        # rotation) from deleting the target while it is being read
+        store.snapshot_running = True
+
+
+        def restored(data):
+            # every day that differs from the last snapshot could change here
+            store.snapshot_dirty.update(store.tasks_data, data, store.snapshot_days or ())
+            store.tasks_data = data
+            store.month_counts = count_by_month(data)
+            self.invalidate_calendar()
+            self.save_data(store)
+            if store is self.store:
+                self.refresh_view()
+            if on_done is not None:
+                on_done()
+
+
+        def read_done(data):
+            store.snapshot_running = False
+            # the undo snapshot may rotate out the target, which is why it was read first
+            if not self.take_snapshot(store, full=True, on_done=lambda: restored(data), on_error=on_error):
+                on_error(RuntimeError("could not save the current state first"))
+
+
+        def read_failed(exc):
+            store.snapshot_running = False
+            on_error(exc)
+
+
+        self.worker.submit(
+            read_snapshot, store.snapshot_dir, snap_id,
+            on_done=read_done, on_error=read_failed, tag="restore"
+        )
+        return True
+
+
+    def open_history_dialog(self):
+        store = self.store
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"History - {store.name}")
+        dialog.geometry("380x380")
+        dialog.configure(bg=BG_PANEL)
+        dialog.transient(self.root)
+
+
+        listbox = tk.Listbox(
+            dialog, font=("Georgia", 10),
+            bg=BG_MAIN, fg=TEXT_MAIN, bd=0, highlightthickness=1,
+            highlightbackground=ACCENT, selectbackground=ACCENT
+        )
+        listbox.pack(fill=tk.BOTH, expand=True, padx=15, pady=(15, 5))
+        status = tk.Label(dialog, text="Loading…", bg=BG_PANEL, fg=ACCENT_DARK,
+                          font=("Georgia", 10, "italic"))
+        status.pack()
+        snapshots = []
+
+
+        def show(found):
+            if not dialog.winfo_exists():
+                return
+            snapshots[:] = found
+            listbox.delete(0, tk.END)
+            for _, created, total in found:
+                listbox.insert(tk.END, f"{created.replace('T', '  ')}   {total} task" + ("" if total == 1 else "s"))
+            status.config(text="" if found else "No snapshots yet")
+
+
+        def reload():
+            self.worker.submit(list_snapshots, store.snapshot_dir, on_done=show, tag="history")
+
+
+        def snapshot_now():
+            if self.take_snapshot(store, full=True, on_done=reload):
+                status.config(text="Saving snapshot…")
+
+
+        def restore():
+            sel = listbox.curselection()
+            if not sel:
+                status.config(text="Pick a snapshot first")
+                return
+            snap_id, created, _ = snapshots[sel[0]]
+
+
+            def restored():
+                if dialog.winfo_exists():
+                    status.config(text=f"Restored {created.replace('T', ' ')}")
+                    reload()
+
+
+            def failed(exc):
+                if dialog.winfo_exists():
+                    status.config(text=f"Restore failed: {exc}")
+
+
+            if self.restore_snapshot(store, snap_id, on_done=restored, on_error=failed):
+                status.config(text="Restoring…")
+            else:
+                status.config(text="A snapshot is being saved, try again")
+
+
+        btn_frame = tk.Frame(dialog, bg=BG_PANEL)
+        btn_frame.pack(pady=10)
+        for text, cmd in (("Snapshot Now", snapshot_now), ("Restore", restore)):
+            tk.Button(
+                btn_frame, text=text, command=cmd,
+                bg=ACCENT, fg="white", font=("Georgia", 10, "bold"),
+                bd=0, padx=12, pady=5
+            ).pack(side=tk.LEFT, padx=5)
+        tk.Button(
+            btn_frame, text="Close", command=dialog.destroy,
+            bg=BG_HEADER, fg=FG_HEADER, font=("Georgia", 10),
+            bd=0, padx=12, pady=5
+        ).pack(side=tk.LEFT, padx=5)
+        reload()
+
+
+    # ---------- local API ----------
+
+
+    def apply_api_ops(self, calendar_name, ops):
+        """Run a list of API operations on the Tk thread; writes share one save"""
+        if calendar_name and calendar_name != self.store.name:
+            if calendar_name not in self.calendar_names():
+                raise LookupError(f"unknown calendar {calendar_name!r}")
+            store = self.open_store(calendar_name)
+        else:
+            store = self.store
+        if not store.loaded:
+            if store.loading:
+                raise CalendarLoading(store.name)
+            raise RuntimeError(f"calendar {store.name!r} could not be read")
+        if not isinstance(ops, list) or not ops:
+            raise ValueError("no operations given")
+
+
+        # validate the whole batch before touching the store, so a failing
+        # request changes nothing and can safely be retried
+        plan = []
+        lengths = {}
+        for op in ops:
+            if not isinstance(op, dict):
+                raise ValueError("each operation must be an object")
+            kind = op.get("op")
+            if kind == "range":
+                start = date.fromisoformat(str(op.get("from", ""))).isoformat()
+                end = date.fromisoformat(str(op.get("to", ""))).isoformat()
+                plan.append((kind, start, end))
+                continue
+            if kind == "counts":
+                plan.append((kind, check_index(op.get("year", date.today().year))))
+                continue
+
+
+            key = date.fromisoformat(str(op.get("date", ""))).isoformat()
+            length = lengths.get(key, len(store.tasks_data.get(key, ())))
+            if kind == "get":
+                plan.append((kind, key))
+            elif kind == "add":
+                plan.append((kind, key, make_task(op.get("task"))))
+                lengths[key] = length + 1
+            elif kind in ("update", "delete"):
+                index = check_index(op.get("index"))
+                if index >= length:
+                    raise IndexError(f"no task {index} on {key}")
+                if kind == "update":
+                    plan.append((kind, key, index, clean_task_fields(op.get("task"))))
+                else:
+                    plan.append((kind, key, index))
+                    lengths[key] = length - 1
+            else:
+                raise ValueError(f"unknown op {kind!r}")
+
+
+        results = []
+        touched = set()
+        for kind, *args in plan:
+            if kind == "range":
+                start, end = args
+                results.append({
+                    k: [dict(t) for t in v]
+                    for k, v in sorted(store.tasks_data.items()) if start <= k <= end
+                })
+            elif kind == "counts":
+                y = args[0]
+                results.append({f"{y:04d}-{m:02d}": store.month_counts.get(f"{y:04d}-{m:02d}", 0)
+                                for m in range(1, 13)})
+            elif kind == "get":
+                results.append([dict(t) for t in store.tasks_data.get(args[0], [])])
+            elif kind == "add":
+                key, task = args
+                store.add_task(key, task)
+                results.append({"date": key, "index": len(store.tasks_data[key]) - 1, "task": dict(task)})
+                touched.add(key)
+            elif kind == "update":
+                key, index, fields = args
+                task = store.update_task(key, index, fields)
+                results.append({"date": key, "index": index, "task": dict(task)})
+                touched.add(key)
+            else:
+                key, index = args
+                results.append({"date": key, "index": index, "task": store.delete_task(key, index)})
+                touched.add(key)
+
+
+        if touched:
+            for key in touched:
+                self.invalidate_store_views(store, key)
+            self.save_data(store)
+            if store is self.store:
+                self.schedule_ui_refresh(touched)
+        return results
+
+
+    def schedule_ui_refresh(self, keys):
+        # one redraw per event-loop pass, and only if a visible day changed
+        if not self.ui_refresh_keys:
+            self.root.after_idle(self.apply_ui_refresh)
+        self.ui_refresh_keys.update(keys)
+
+
+    def apply_ui_refresh(self):
+        keys, self.ui_refresh_keys = self.ui_refresh_keys, set()
+        if self.current_view == "day":
+            if self.date_key(self.current_date) in keys:
+                self.refresh_tasks()
+        elif self.current_view == "year" or self.combined:
+            if any(k[:4] == f"{self.current_year:04d}" for k in keys):
+                self.refresh_view()
+        elif any(k[:7] == self.current_date.isoformat()[:7] for k in keys):
+            self.show_month_view()
+
+
+    # ---------- view cache + prefetch ----------
+
+
+    def view_source(self):
+        # (cache id, day count lookup, month counts) for whatever is on screen
+        if self.combined:
+            day_counts, month_counts = self.combined_day_counts()
+            return ALL_CALENDARS, (lambda k: day_counts.get(k, 0)), month_counts
+        tasks_data = self.store.tasks_data
+        return self.store.name, (lambda k: len(tasks_data.get(k, ()))), self.store.month_counts
+
+
+    def invalidate_views(self, key):
+        self.invalidate_store_views(self.store, key)
+
+
+    def invalidate_store_views(self, store, key):
+        y, m = int(key[:4]), int(key[5:7])
+        for cal in (store.name, ALL_CALENDARS):
+            self.view_cache.pop((cal, "month", y, m))
+            self.view_cache.pop((cal, "year", y))
+        self.combined_counts = None
+        # a prefetch already running may have read the old counts
+        self.worker.cancel("prefetch")
+
+
+    def invalidate_calendar(self):
+        self.view_cache.clear()
+        self.combined_counts = None
+        self.worker.cancel("prefetch")
+
+
+    def month_model(self, y, m, store=None):
+        # store=... gives that one calendar's counts even in the combined view
+        if store is not None:
+            tasks_data = store.tasks_data
+            cal, count_of = store.name, (lambda k: len(tasks_data.get(k, ())))
+        else:
+            cal, count_of, _ = self.view_source()
+        model = self.view_cache.get((cal, "month", y, m))
+        if model is None:
+            model = build_month_model(count_of, y, m)
+            self.view_cache.put((cal, "month", y, m), model)
+        return model
+
+
+    def year_model(self, y):
+        cal, _, month_counts = self.view_source()
+        model = self.view_cache.get((cal, "year", y))
+        if model is None:
+            model = build_year_model(month_counts, y)
+            self.view_cache.put((cal, "year", y), model)
+        return model
+
+
+    def schedule_prefetch(self, keys):
+        # drop whatever the previous view queued; only the newest neighbours matter
+        self.worker.cancel("prefetch")
+        if self.prefetch_job is not None:
+            self.root.after_cancel(self.prefetch_job)
+        self.prefetch_job = self.root.after_idle(lambda: self.prefetch(keys))
+
+
+    def prefetch(self, keys):
+        self.prefetch_job = None
+        if not self.loaded:
+            return
+        cal, count_of, month_counts = self.view_source()
+        for key in keys:
+            key = (cal,) + key
+            if key in self.view_cache:
+                continue
+            if key[1] == "month":
+                fn, args = build_month_model, (count_of, key[2], key[3])
+            else:
+                fn, args = build_year_model, (month_counts, key[2])
+            self.worker.submit(
+                fn, *args,
+                on_done=lambda model, k=key: self.view_cache.put(k, model),
+                tag="prefetch"
+            )
+
+
     # ---------- shell + add row ----------
 
 
@@ -156,6 +1484,28 @@ class YearlyTodoApp:
         ).pack(side=tk.LEFT, padx=20, pady=10)
 
 
+        # Calendar picker: one store per name, plus a read-only combined view
+        self.calendar_var = tk.StringVar(value=self.store.name)
+        self.calendar_picker = ttk.Combobox(
+            self.title_bar, textvariable=self.calendar_var,
+            width=14, state="readonly", font=("Georgia", 10)
+        )
+        self.calendar_picker.pack(side=tk.LEFT, pady=10)
+        self.calendar_picker.bind(
+            "<<ComboboxSelected>>",
+            lambda e: self.switch_calendar(self.calendar_var.get())
+        )
+        tk.Button(
+            self.title_bar, text="+", command=self.new_calendar_dialog,
+            font=("Georgia", 10, "bold"),
+            bg=BG_HEADER, fg=FG_HEADER,
+            activebackground=ACCENT_DARK, activeforeground=FG_HEADER,
+            bd=0, padx=8, pady=2,
+            highlightthickness=1, highlightbackground=ACCENT
+        ).pack(side=tk.LEFT, padx=5)
+        self.update_calendar_picker()
+
+
         controls = tk.Frame(self.title_bar, bg=BG_HEADER)
         controls.pack(side=tk.RIGHT, padx=20)
 
@@ -174,6 +1524,8 @@ class YearlyTodoApp:
         fancy_btn("Today", self.go_today).pack(side=tk.LEFT, padx=5)
         fancy_btn("Year", self.show_year_view).pack(side=tk.LEFT, padx=5)
         fancy_btn("Month", self.show_month_view).pack(side=tk.LEFT, padx=5)
+        fancy_btn("Roll Over", self.open_rollover_dialog).pack(side=tk.LEFT, padx=5)
+        fancy_btn("History", self.open_history_dialog).pack(side=tk.LEFT, padx=5)
         fancy_btn("Save", self.save_data).pack(side=tk.LEFT, padx=5)
 
 
@@ -278,10 +1630,20 @@ class YearlyTodoApp:
 
 
     def clear_content(self):
+        self.cancel_drag()
         for w in self.content.winfo_children():
             w.destroy()
 
 
+    def refresh_view(self):
+        if self.current_view == "day":
+            self.show_day_view(self.current_date)
+        elif self.current_view == "year":
+            self.show_year_view()
+        else:
+            self.show_month_view()
+
+
     # ---------- year view ----------
 
 
@@ -324,11 +1686,11 @@ class YearlyTodoApp:
                   "Sep", "Oct", "Nov", "Dec"]
 
 
+        model = self.year_model(self.current_year)
         for i, name in enumerate(months):
             r, c = divmod(i, 4)
             m = i + 1
-            count = self.month_task_count(m)
-            bg = "#d8e4dd" if count > 0 else "#e8dfcf"
+            count, bg = model[i]
             btn = tk.Button(
                 grid,
                 text=f"{name}\n{count} tasks",
@@ -348,14 +1710,8 @@ class YearlyTodoApp:
             grid.grid_rowconfigure(r, weight=1)
 
 
-    def month_task_count(self, month_num):
         y = self.current_year
-        total = 0
-        days_in_month = calendar.monthrange(y, month_num)[1]
-        for d in range(1, days_in_month + 1):
-            k = date(y, month_num, d).isoformat()
-            total += len(self.tasks_data.get(k, []))
-        return total
+        self.schedule_prefetch([("year", y - 1), ("year", y + 1)])
 
 
     def prev_year(self):
@@ -422,8 +1778,10 @@ class YearlyTodoApp:
 
 
         y, m = self.current_date.year, self.current_date.month
-        first_wd = date(y, m, 1).weekday()  # 0 = Mon
-        days_in_month = calendar.monthrange(y, m)[1]
+        model = self.month_model(y, m)
+        first_wd = model["first_wd"]  # 0 = Mon
+        days_in_month = len(model["cells"])
+        today = date.today()
 
 
         day_num = 1
@@ -433,10 +1791,9 @@ class YearlyTodoApp:
                     tk.Label(cal_frame, text="", bg=BG_MAIN).grid(row=r, column=c, sticky="nsew", padx=1, pady=1)
                 else:
                     d_date = date(y, m, day_num)
-                    k = self.date_key(d_date)
-                    count = len(self.tasks_data.get(k, []))
-                    text = f"{day_num}\n{count} task" + ("" if count == 1 else "s")
-                    bg = "#ffef9c" if d_date == date.today() else ("#d8e4dd" if count > 0 else "#e8dfcf")
+                    _, count, text, bg = model["cells"][day_num - 1]
+                    if d_date == today:
+                        bg = "#ffef9c"
                     btn = tk.Button(
                         cal_frame, text=text,
                         command=lambda dd=d_date: self.show_day_view(dd),
@@ -454,6 +1811,11 @@ class YearlyTodoApp:
             cal_frame.grid_rowconfigure(r, weight=1)
 
 
+        prev_y, prev_m = (y - 1, 12) if m == 1 else (y, m - 1)
+        next_y, next_m = (y + 1, 1) if m == 12 else (y, m + 1)
+        self.schedule_prefetch([("month", prev_y, prev_m), ("month", next_y, next_m), ("year", y)])
+
+
     def prev_month(self):
         if self.current_month == 1:
             self.current_month = 12
@@ -483,9 +1845,12 @@ class YearlyTodoApp:
         self.clear_content()
 
 
+        title = selected_date.strftime("%A, %d %B %Y")
+        if self.combined:
+            title += f"  ·  {self.store.name}"
         header = tk.Label(
             self.content,
-            text=selected_date.strftime("%A, %d %B %Y"),
+            text=title,
             font=("Georgia", 16, "bold"),
             bg=BG_MAIN, fg=TEXT_MAIN
         )
@@ -507,6 +1872,7 @@ class YearlyTodoApp:
 
 
         self.table_frame = table
+        self.build_drop_month(selected_date)
         self.refresh_tasks()
 
 
@@ -514,6 +1880,93 @@ class YearlyTodoApp:
             table.grid_columnconfigure(c, weight=1)
 
 
+    def build_drop_month(self, selected_date):
+        # Small month grid under the day table: drag a task onto a cell to move it
+        strip = tk.Frame(self.content, bg=BG_MAIN)
+        strip.pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 0))
+
+
+        hint = "Drag a task onto a day to move it"
+        if self.combined:
+            hint += f" within {self.store.name}"
+        tk.Label(
+            strip, text=hint,
+            font=("Georgia", 9, "italic"),
+            bg=BG_MAIN, fg=ACCENT_DARK
+        ).pack(anchor="w")
+
+
+        cells = tk.Frame(strip, bg=BG_MAIN)
+        cells.pack(fill=tk.X)
+
+
+        y, m = selected_date.year, selected_date.month
+        model = self.month_model(y, m, store=self.store)
+
+
+        self.drop_targets = {}
+        for day_num, _, _, bg in model["cells"]:
+            r, c = divmod(model["first_wd"] + day_num - 1, 7)
+            d_date = date(y, m, day_num)
+            if d_date == selected_date:
+                bg = ACCENT
+            cell = tk.Label(
+                cells, text=str(day_num),
+                font=("Georgia", 9), width=4,
+                bg=bg, fg=TEXT_MAIN
+            )
+            cell.grid(row=r, column=c, sticky="nsew", padx=1, pady=1)
+            self.drop_targets[str(cell)] = d_date
+
+
+        for c in range(7):
+            cells.grid_columnconfigure(c, weight=1)
+
+
+    def start_drag(self, index, event):
+        # the floating label only appears once the pointer really moves
+        self.cancel_drag()
+        self.drag_index = index
+        self.drag_origin = (event.x_root, event.y_root)
+
+
+    def drag_motion(self, event):
+        if getattr(self, "drag_origin", None) is None:
+            return
+        if self.drag_label is None:
+            x0, y0 = self.drag_origin
+            if abs(event.x_root - x0) < DRAG_THRESHOLD and abs(event.y_root - y0) < DRAG_THRESHOLD:
+                return
+            self.drag_label = tk.Toplevel(self.root)
+            self.drag_label.overrideredirect(True)
+            tk.Label(
+                self.drag_label, text=event.widget.cget("text"),
+                font=("Georgia", 10), bg=ACCENT, fg="white", padx=6, pady=2
+            ).pack()
+        self.drag_label.geometry(f"+{event.x_root + 12}+{event.y_root + 8}")
+
+
+    def cancel_drag(self):
+        # rows can be rebuilt mid-drag, and then ButtonRelease never arrives
+        if getattr(self, "drag_label", None) is not None:
+            self.drag_label.destroy()
+        self.drag_label = None
+        self.drag_origin = None
+
+
+    def end_drag(self, event):
+        dragging = getattr(self, "drag_label", None) is not None
+        self.cancel_drag()
+        if not dragging:
+            return
+
+
+        target = self.root.winfo_containing(event.x_root, event.y_root)
+        target_date = self.drop_targets.get(str(target)) if target is not None else None
+        if target_date is not None and target_date != self.current_date:
+            self.move_task(self.drag_index, target_date)
+
+
     # ---------- task ops ----------
 
 
@@ -522,22 +1975,19 @@ class YearlyTodoApp:
         start_time = self.start_time_text
         end_time = self.end_time_text
         fb = self.feedback_entry.get().strip()
-        if not text:
+        if not text or not self.loaded:
             return
 
 
         key = self.date_key(self.current_date)
-        if key not in self.tasks_data:
-            self.tasks_data[key] = []
-
-
-        self.tasks_data[key].append({
+        self.store.add_task(key, {
             "text": text,
             "start_time": start_time,
             "end_time": end_time,
             "feedback": fb,
             "done": False
         })
+        self.invalidate_views(key)
 
 
         self.task_entry.delete(0, tk.END)
@@ -555,6 +2005,7 @@ class YearlyTodoApp:
 
 
         # clear rows except header
+        self.cancel_drag()
         for w in self.table_frame.winfo_children():
             if w.grid_info()["row"] != 0:
                 w.destroy()
@@ -600,11 +2051,21 @@ class YearlyTodoApp:
             cb.bind("<Button-3>", make_right_click(i))
 
 
-            # Task text
-            tk.Label(
+            # Task text (drag source for moving to another day)
+            text_label = tk.Label(
                 self.table_frame, text=task["text"],
-                bg=bg, fg=TEXT_MAIN, font=task_font
-            ).grid(row=row, column=1, sticky="w", padx=4, pady=4)
+                bg=bg, fg=TEXT_MAIN, font=task_font, cursor="fleur"
+            )
+            text_label.grid(row=row, column=1, sticky="w", padx=4, pady=4)
+
+
+            def make_drag_start(idx):
+                return lambda e: self.start_drag(idx, e)
+
+
+            text_label.bind("<ButtonPress-1>", make_drag_start(i))
+            text_label.bind("<B1-Motion>", self.drag_motion)
+            text_label.bind("<ButtonRelease-1>", self.end_drag)
 
 
             # Time (never struck through)
@@ -630,8 +2091,7 @@ class YearlyTodoApp:
                     start_t = datetime.strptime(task["start_time"], "%H:%M").time()
                     task_dt = datetime.combine(self.current_date, start_t)
                     if now > task_dt and SCOLD_TEXT not in feedback_text:
-                        feedback_text = (feedback_text + "  |  " + SCOLD_TEXT).strip()
-                        task["feedback"] = feedback_text
+                        feedback_text = self.store.scold_task(key, i)
                         self.save_data()
                 except ValueError:
                     pass  # invalid time format, ignore
@@ -663,7 +2123,8 @@ class YearlyTodoApp:
             return
 
 
-        task = self.tasks_data[key][index]
+        store = self.store
+        task = store.tasks_data[key][index]
 
 
         editor = tk.Toplevel(self.root)
@@ -691,9 +2152,14 @@ class YearlyTodoApp:
 
 
         def save_times():
-            task["start_time"] = start_selector.selected_time.get()
-            task["end_time"] = end_selector.selected_time.get()
-            self.save_data()
+            # the selectors run their own event loop, so the list may have changed meanwhile
+            current = store.index_of(key, task)
+            if current is not None:
+                store.update_task(key, current, {
+                    "start_time": start_selector.selected_time.get(),
+                    "end_time": end_selector.selected_time.get(),
+                })
+                self.save_data(store)
             self.refresh_tasks()
             editor.destroy()
 
@@ -719,7 +2185,8 @@ class YearlyTodoApp:
             return
 
 
-        task = self.tasks_data[key][index]
+        store = self.store
+        task = store.tasks_data[key][index]
         old_feedback = task.get("feedback", "")
 
 
@@ -736,8 +2203,10 @@ class YearlyTodoApp:
 
         def finish_edit(event=None):
             new_feedback = entry.get().strip()
-            task["feedback"] = new_feedback
-            self.save_data()
+            current = store.index_of(key, task)
+            if current is not None:
+                store.update_task(key, current, {"feedback": new_feedback})
+                self.save_data(store)
             self.refresh_tasks()
 
 
@@ -756,16 +2225,7 @@ class YearlyTodoApp:
             return
 
 
-        task = self.tasks_data[key][index]
-
-
-        task["done"] = not task["done"]
-
-
-        if task["done"] and task.get("feedback"):
-            task["feedback"] = task["feedback"].replace(SCOLD_TEXT, "").replace("  |  ", " ").strip()
-
-
+        self.store.toggle_task(key, index)
         self.save_data()
         self.refresh_tasks()
 
@@ -774,13 +2234,111 @@ class YearlyTodoApp:
         key = self.date_key(self.current_date)
         if key not in self.tasks_data or index >= len(self.tasks_data[key]):
             return
-        del self.tasks_data[key][index]
-        if not self.tasks_data[key]:
-            del self.tasks_data[key]
+        self.store.delete_task(key, index)
+        self.invalidate_views(key)
         self.save_data()
         self.refresh_tasks()
 
 
+    def move_task(self, index, target_date):
+        key = self.date_key(self.current_date)
+        if key not in self.tasks_data or index >= len(self.tasks_data[key]):
+            return
+        target_key = self.date_key(target_date)
+        self.store.move_task(key, index, target_key)
+        self.invalidate_views(key)
+        self.invalidate_views(target_key)
+        self.save_data()
+        self.show_day_view(self.current_date)
+
+
+    def rollover_unfinished(self, start, end, target, store=None):
+        """Move every unfinished task dated start..end onto target, saving once"""
+        store = store or self.store
+        start_key, end_key = self.date_key(start), self.date_key(end)
+        target_key = self.date_key(target)
+
+
+        moved, touched = store.rollover(start_key, end_key, target_key)
+        for key in touched:
+            self.invalidate_store_views(store, key)
+        if moved:
+            self.save_data(store)
+        return moved
+
+
+    def open_rollover_dialog(self):
+        # the calendar is fixed when the dialog opens, and named so it is clear
+        # which one is changed while "All calendars" is on screen
+        store = self.store
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"Roll Over Unfinished - {store.name}")
+        dialog.geometry("340x300")
+        dialog.configure(bg=BG_PANEL)
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+
+        today = date.today()
+        yesterday = date.fromordinal(today.toordinal() - 1)
+        defaults = [
+            ("From", yesterday.replace(day=1)),
+            ("To", yesterday),
+            ("Move to", today),
+        ]
+
+
+        tk.Label(dialog, text=f"Calendar: {store.name}", bg=BG_PANEL, fg=ACCENT_DARK,
+                 font=("Georgia", 10, "italic")).grid(row=0, column=0, columnspan=2, sticky="w", padx=20, pady=(10, 0))
+
+
+        entries = []
+        for r, (label, value) in enumerate(defaults, start=1):
+            tk.Label(dialog, text=label, bg=BG_PANEL, fg=TEXT_MAIN,
+                     font=("Georgia", 10, "bold")).grid(row=r, column=0, sticky="w", padx=(20, 10), pady=8)
+            entry = tk.Entry(
+                dialog, font=("Georgia", 10), width=14,
+                bg=BG_MAIN, bd=0, highlightthickness=1,
+                highlightbackground=ACCENT
+            )
+            entry.insert(0, value.isoformat())
+            entry.grid(row=r, column=1, sticky="w", pady=8)
+            entries.append(entry)
+
+
+        status = tk.Label(dialog, text="", bg=BG_PANEL, fg=ACCENT_DARK,
+                          font=("Georgia", 10, "italic"))
+        status.grid(row=4, column=0, columnspan=2, pady=(4, 0))
+
+
+        def do_rollover():
+            try:
+                start, end, target = (date.fromisoformat(e.get().strip()) for e in entries)
+            except ValueError:
+                status.config(text="Dates must look like YYYY-MM-DD")
+                return
+            if start > end:
+                status.config(text="'From' must not be after 'To'")
+                return
+            moved = self.rollover_unfinished(start, end, target, store=store)
+            status.config(text=f"Moved {moved} task" + ("" if moved == 1 else "s"))
+            self.refresh_view()
+
+
+        btn_frame = tk.Frame(dialog, bg=BG_PANEL)
+        btn_frame.grid(row=5, column=0, columnspan=2, pady=15)
+        tk.Button(
+            btn_frame, text="Roll Over", command=do_rollover,
+            bg=ACCENT, fg="white", font=("Georgia", 10, "bold"),
+            bd=0, padx=20, pady=5
+        ).pack(side=tk.LEFT, padx=5)
+        tk.Button(
+            btn_frame, text="Close", command=dialog.destroy,
+            bg=BG_HEADER, fg=FG_HEADER, font=("Georgia", 10),
+            bd=0, padx=20, pady=5
+        ).pack(side=tk.LEFT, padx=5)
+
+
     # ---------- misc ----------
 
 
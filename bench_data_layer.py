@@ -0,0 +1,122 @@
+"""Load test for the task data layer.
+
+    python bench_data_layer.py [OPS] [SEED]
+
+Runs a random add/toggle/edit/scold/delete stream against a CalendarStore,
+checking invariants along the way, then reports throughput for each storage
+layer: the in-memory store, the JSON file and snapshots.
+"""
+from datetime import date
+import json
+import random
+import sys
+import tempfile
+import time
+
+
+from Yearly_to_do_planner import (
+    SCOLD_TEXT, SNAPSHOT_KEEP, CalendarStore,
+    list_snapshots, read_snapshot, read_tasks_file, write_snapshot, write_tasks_file,
+)
+
+
+OP_NAMES = ("add", "toggle", "edit", "scold", "delete")
+
+
+def apply_random_ops(store, rng, count, first_day, span, stats=None, check_every=0):
+    # one randomly chosen operation per step, on a random day in the span
+    stats = stats if stats is not None else dict.fromkeys(OP_NAMES, 0)
+    for n in range(count):
+        key = date.fromordinal(first_day + rng.randrange(span)).isoformat()
+        tasks = store.tasks_data.get(key)
+        roll = rng.random()
+        if not tasks or roll < 0.4:
+            store.add_task(key, {
+                "text": f"task {n}", "start_time": f"{rng.randrange(24):02d}:00",
+                "end_time": f"{rng.randrange(24):02d}:30", "feedback": "", "done": False
+            })
+            stats["add"] += 1
+            continue
+        index = rng.randrange(len(tasks))
+        if roll < 0.6:
+            store.toggle_task(key, index)
+            stats["toggle"] += 1
+        elif roll < 0.75:
+            store.update_task(key, index, {"feedback": f"note {n}"})
+            stats["edit"] += 1
+        elif roll < 0.85:
+            if not tasks[index]["done"] and SCOLD_TEXT not in tasks[index]["feedback"]:
+                store.scold_task(key, index)
+                stats["scold"] += 1
+        else:
+            store.delete_task(key, index)
+            stats["delete"] += 1
+        if check_every and (n + 1) % check_every == 0:
+            problems = store.check_invariants()
+            if problems:
+                raise RuntimeError(f"after {n + 1} ops: " + "; ".join(problems[:5]))
+    return stats
+
+
+def run(num_ops=1000000, seed=0, years=6, out=print):
+    rng = random.Random(seed)
+    first_day = date(date.today().year - years // 2, 1, 1).toordinal()
+    span = years * 366
+
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = CalendarStore("bench", tmp)
+        store.loaded = True
+
+
+        started = time.perf_counter()
+        stats = apply_random_ops(store, rng, num_ops, first_day, span, check_every=max(1, num_ops // 10))
+        elapsed = time.perf_counter() - started
+        total = sum(store.month_counts.values())
+        out(f"memory     {num_ops:>10} ops  {num_ops / elapsed:>12,.0f} ops/s  "
+            f"({', '.join(f'{k} {v}' for k, v in stats.items())})")
+
+
+        started = time.perf_counter()
+        write_tasks_file(store.path, store.tasks_data, store.counts_path)
+        data, month_counts = read_tasks_file(store.path)
+        elapsed = time.perf_counter() - started
+        with open(store.counts_path, "r") as f:
+            counted = sum(json.load(f).values())
+        if data != store.tasks_data or month_counts != store.month_counts or counted != total:
+            raise RuntimeError("json round trip does not match the store")
+        out(f"json       {total:>10} tasks {total / elapsed:>12,.0f} tasks/s  (write + read)")
+
+
+        snap_ops = max(1, num_ops // 100)
+        timings = []
+        for full in (True, False):
+            if not full:
+                apply_random_ops(store, rng, snap_ops, first_day, span)
+            keys = set(store.tasks_data) | set(store.snapshot_days or ()) if full else store.snapshot_dirty
+            changed = {k: store.tasks_data.get(k, []) for k in keys}
+            started = time.perf_counter()
+            store.snapshot_days = write_snapshot(
+                store.snapshot_dir, store.snapshot_days, changed,
+                sum(store.month_counts.values()), SNAPSHOT_KEEP
+            )
+            timings.append((len(changed), time.perf_counter() - started))
+            store.snapshot_dirty = set()
+        snap_id = list_snapshots(store.snapshot_dir)[0][0]
+        if read_snapshot(store.snapshot_dir, snap_id) != store.tasks_data:
+            raise RuntimeError("snapshot round trip does not match the store")
+        (full_days, full_time), (delta_days, delta_time) = timings
+        out(f"snapshot   {full_days:>10} days  {full_days / full_time:>12,.0f} days/s  (full)")
+        out(f"snapshot   {delta_days:>10} days  {delta_days / delta_time:>12,.0f} days/s  "
+            f"(incremental after {snap_ops} ops)")
+
+
+        problems = store.check_invariants()
+        if problems:
+            raise RuntimeError("final state: " + "; ".join(problems[:5]))
+        out(f"ok: {total} tasks over {len(store.tasks_data)} days, invariants hold")
+    return stats
+
+
+if __name__ == "__main__":
+    run(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,174 @@
+"""Property checks for the date-keyed task store, driven by random operation streams."""
+from datetime import date
+import random
+
+
+import pytest
+
+
+from bench_data_layer import apply_random_ops
+from Yearly_to_do_planner import (
+    SCOLD_TEXT, CalendarStore, build_year_model, list_snapshots,
+    read_calendar_file, read_snapshot, read_tasks_file, write_snapshot, write_tasks_file,
+)
+
+
+FIRST_DAY = date(2025, 1, 1).toordinal()
+SPAN = date(2027, 1, 1).toordinal() - FIRST_DAY  # all of 2025 and 2026
+OPS = 5000
+
+
+def new_store(tmp_path):
+    store = CalendarStore("test", str(tmp_path))
+    store.loaded = True
+    return store
+
+
+def task(text="t", done=False, feedback=""):
+    return {"text": text, "start_time": "09:00", "end_time": "10:00", "feedback": feedback, "done": done}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_stream_keeps_invariants(tmp_path, seed):
+    store = new_store(tmp_path)
+    stats = apply_random_ops(store, random.Random(seed), OPS, FIRST_DAY, SPAN, check_every=500)
+
+
+    assert sum(stats.values()) <= OPS
+    assert store.check_invariants() == []
+    assert all(store.tasks_data.values())
+    for tasks in store.tasks_data.values():
+        for t in tasks:
+            assert not (t["done"] and SCOLD_TEXT in t["feedback"])
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_month_counts_match_month_task_count(tmp_path, seed):
+    store = new_store(tmp_path)
+    apply_random_ops(store, random.Random(seed), OPS, FIRST_DAY, SPAN)
+
+
+    total = 0
+    for y in (2025, 2026):
+        year_model = build_year_model(store.month_counts, y)
+        for m in range(1, 13):
+            recount = store.month_task_count(y, m)
+            assert store.month_counts.get(f"{y:04d}-{m:02d}", 0) == recount
+            assert year_model[m - 1][0] == recount
+            total += recount
+    assert total == sum(len(v) for v in store.tasks_data.values())
+
+
+def test_delete_removes_empty_day(tmp_path):
+    store = new_store(tmp_path)
+    store.add_task("2026-03-04", task("a"))
+    store.add_task("2026-03-04", task("b"))
+
+
+    assert store.delete_task("2026-03-04", 0)["text"] == "a"
+    assert store.tasks_data == {"2026-03-04": [task("b")]}
+    store.delete_task("2026-03-04", 0)
+    assert "2026-03-04" not in store.tasks_data
+    assert store.month_counts == {}
+    with pytest.raises(KeyError):
+        store.delete_task("2026-03-04", 0)
+
+
+def test_done_tasks_drop_scold_text(tmp_path):
+    store = new_store(tmp_path)
+    store.add_task("2026-03-04", task(feedback="call back"))
+    store.scold_task("2026-03-04", 0)
+    assert SCOLD_TEXT in store.tasks_data["2026-03-04"][0]["feedback"]
+
+
+    store.toggle_task("2026-03-04", 0)
+    assert store.tasks_data["2026-03-04"][0]["feedback"] == "call back"
+    assert store.check_invariants() == []
+
+
+def test_index_of_tracks_identity(tmp_path):
+    store = new_store(tmp_path)
+    first, second = task("same"), task("same")
+    store.add_task("2026-03-04", first)
+    store.add_task("2026-03-04", second)
+
+
+    store.delete_task("2026-03-04", 0)
+    assert store.index_of("2026-03-04", second) == 0
+    assert store.index_of("2026-03-04", first) is None
+
+
+def test_storage_round_trips(tmp_path):
+    store = new_store(tmp_path)
+    rng = random.Random(7)
+    apply_random_ops(store, rng, OPS, FIRST_DAY, SPAN)
+
+
+    write_tasks_file(store.path, store.tasks_data, store.counts_path)
+    assert read_tasks_file(store.path) == (store.tasks_data, store.month_counts)
+
+
+    store.snapshot_days = write_snapshot(store.snapshot_dir, None, store.tasks_data, 0, 5)
+    store.snapshot_dirty = set()
+    apply_random_ops(store, rng, 200, FIRST_DAY, SPAN)
+    changed = {k: store.tasks_data.get(k, []) for k in store.snapshot_dirty}
+    write_snapshot(store.snapshot_dir, store.snapshot_days, changed, 0, 5)
+
+
+    latest = list_snapshots(store.snapshot_dir)[0][0]
+    assert read_snapshot(store.snapshot_dir, latest) == store.tasks_data
+
+
+def test_load_lines_up_with_last_snapshot(tmp_path):
+    store = new_store(tmp_path)
+    rng = random.Random(11)
+    apply_random_ops(store, rng, OPS, FIRST_DAY, SPAN)
+    days = write_snapshot(store.snapshot_dir, None, store.tasks_data, 0, 5)
+
+
+    # edits saved after the last snapshot, as a previous session would leave them
+    store.snapshot_dirty = set()
+    apply_random_ops(store, rng, 200, FIRST_DAY, SPAN)
+    write_tasks_file(store.path, store.tasks_data, store.counts_path)
+
+
+    data, month_counts, loaded_days, stale = read_calendar_file(store.path, store.snapshot_dir)
+    assert (data, month_counts, loaded_days) == (store.tasks_data, store.month_counts, days)
+    assert stale <= store.snapshot_dirty
+
+
+    changed = {k: data.get(k, []) for k in stale}
+    write_snapshot(store.snapshot_dir, loaded_days, changed, 0, 5)
+    assert read_snapshot(store.snapshot_dir, list_snapshots(store.snapshot_dir)[0][0]) == data
+    assert read_calendar_file(str(tmp_path / "missing.json"), str(tmp_path / "none"))[2:] == (None, set())
+
+
+def total_tasks(store):
+    return sum(len(v) for v in store.tasks_data.values())
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rollovers_and_moves_interleaved_with_random_stream(tmp_path, seed):
+    store = new_store(tmp_path)
+    rng = random.Random(seed)
+    day = lambda: date.fromordinal(FIRST_DAY + rng.randrange(SPAN)).isoformat()
+    for _ in range(40):
+        apply_random_ops(store, rng, 100, FIRST_DAY, SPAN)
+        before = total_tasks(store)
+        if rng.random() < 0.5:
+            start, end = sorted((day(), day()))
+            target = day()
+            moved, touched = store.rollover(start, end, target)
+            assert bool(moved) == bool(touched)
+            for key, tasks in store.tasks_data.items():
+                if start <= key <= end and key != target:
+                    assert all(t["done"] for t in tasks)
+        else:
+            key = rng.choice(sorted(store.tasks_data))
+            index = rng.randrange(len(store.tasks_data[key]))
+            target = day()
+            task = store.move_task(key, index, target)
+            assert store.tasks_data[target][-1] is task
+            assert SCOLD_TEXT not in task["feedback"]
+        assert total_tasks(store) == before
+        assert store.check_invariants() == []